@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 import uuid
 from difflib import unified_diff
 from pathlib import Path
@@ -26,10 +27,11 @@ from code_cli.ui.event_bus import UIEventBus
 from code_cli.ui.events import UIEvent
 from code_cli.ui.project_tree import FilePinMessage
 
-from .cards import AgentMessageCard, DiffCard
+from .cards import AgentMessageCard, DiffCard, ToolCallCard, ToolResultCard
 from .header import CodenticHeader
 from .layout import (
     CenterPane,
+    CodeOutputPane,
     ComposerBar,
     InspectorDrawer,
     LeftRail,
@@ -50,6 +52,18 @@ from .widgets import (
 
 logger = logging.getLogger(__name__)
 
+# tool name -> (reason, risk) shown in the approval modal
+_TOOL_RISK: dict[str, tuple[str, str]] = {
+    "write_file": ("Modifies workspace files", "High"),
+    "str_replace": ("Modifies workspace files", "High"),
+    "run_command": ("Executes shell commands", "High"),
+    "git_commit": ("Changes repository state", "Medium"),
+    "git_add": ("Changes repository state", "Medium"),
+}
+_DEFAULT_TOOL_RISK = ("Tool execution", "Low")
+
+_LEFT_BUTTON = 1
+
 
 class CodeApp(App):
     """
@@ -195,6 +209,11 @@ class CodeApp(App):
 
     #transcript-list {
         width: 100%;
+        height: auto;
+    }
+
+    .transcript-spacer {
+        height: 0;
     }
 
     CodeOutputPane {
@@ -420,14 +439,17 @@ class CodeApp(App):
         self.workspace = Path.cwd()
         self.config = Config.load()
         self.tools = ToolRegistry(load_plugins=False)
-        self.tools.register(ReadFileTool(self.workspace))
-        self.tools.register(WriteFileTool(self.workspace))
-        self.tools.register(StrReplaceTool(self.workspace))
-        self.tools.register(GitStatusTool(self.workspace))
-        self.tools.register(GitAddTool(self.workspace))
-        self.tools.register(GitCommitTool(self.workspace))
-        self.tools.register(AWSResourceLister())
-        self.tools.register(K8sLogFetcher())
+        for tool in (
+            ReadFileTool(self.workspace),
+            WriteFileTool(self.workspace),
+            StrReplaceTool(self.workspace),
+            GitStatusTool(self.workspace),
+            GitAddTool(self.workspace),
+            GitCommitTool(self.workspace),
+            AWSResourceLister(),
+            K8sLogFetcher(),
+        ):
+            self.tools.register(tool)
         self.tools.register(
             ShellTool(
                 self.workspace,
@@ -448,7 +470,6 @@ class CodeApp(App):
         )
 
         self.event_bus = UIEventBus()
-        self._stream_buffer = ""
         self._stream_card: AgentMessageCard | None = None
         self._active_card = None
         self._thinking = False
@@ -457,10 +478,22 @@ class CodeApp(App):
         self._pinned_files: list[str] = []
         self.safety_state = SafeArmState.SAFE
         self._palette_commands = self._build_palette_commands()
+        self._palette_dispatch = {
+            "toggle_mode": self.action_toggle_mode,
+            "clear_transcript": self.action_clear_transcript,
+            "focus_rail": self.action_focus_rail,
+            "toggle_rail": self.action_toggle_rail,
+            "focus_navigator": self.action_focus_navigator,
+            "focus_transcript": self.action_focus_transcript,
+            "focus_inspector": self.action_focus_inspector,
+            "focus_composer": self.action_focus_composer,
+            "toggle_output": self._palette_toggle_output,
+        }
         self._focus_mode = False
         self._tokens_received = 0
         self._stream_start_time = 0.0
         self._last_tokens_per_sec_update = 0.0
+        self._pending_ui_sync = False
 
     def _build_palette_commands(self) -> list[PaletteCommand]:
         return [
@@ -493,13 +526,7 @@ class CodeApp(App):
         return approved
 
     def _tool_risk_reason(self, tool_name: str) -> tuple[str, str]:
-        if tool_name in {"write_file", "str_replace"}:
-            return "Modifies workspace files", "High"
-        if tool_name == "run_command":
-            return "Executes shell commands", "High"
-        if tool_name in {"git_commit", "git_add"}:
-            return "Changes repository state", "Medium"
-        return "Tool execution", "Low"
+        return _TOOL_RISK.get(tool_name, _DEFAULT_TOOL_RISK)
 
     async def _build_diff_preview(self, tool_name: str, arguments: dict) -> str:
         if tool_name == "write_file":
@@ -569,7 +596,6 @@ class CodeApp(App):
         Initializes background workers for:
         - Polling available models.
         - Draining UI events from the bus.
-        - Flushing the stream buffer to the UI.
         - Loading tool plugins.
         - Checking provider health.
         """
@@ -577,10 +603,18 @@ class CodeApp(App):
         inspector = InspectorDrawer(id="inspector-drawer")
         self.mount(inspector)
         # Styles are set via CSS (dock: right, layer: overlay, display: none)
+
+        # These widgets live for the whole session; look them up once
+        self._header = self.query_one(CodenticHeader)
+        self._transcript = self.query_one(TranscriptPane)
+        self._inspector = inspector
+        self._rail = self.query_one(LeftRail)
+        self._output_pane = self.query_one(CodeOutputPane)
+        self._activity_bar = self.query_one(PinnedActivityBar)
+        self._composer = self.query_one("#composer-input", Input)
         
         self.set_interval(10.0, self._poll_models)
         self.set_interval(0.05, self._drain_events)
-        self.set_interval(0.05, self._flush_stream)
         self.set_interval(0.5, self._update_header_metrics)
         self.set_interval(1.0, self._update_activity_elapsed)
         self.run_worker(self._load_plugins(), group="plugins")
@@ -589,25 +623,25 @@ class CodeApp(App):
         self._sync_sessions()
         
         # Force focus on input on mount
-        self.set_focus(self.query_one("#composer-input", Input))
+        self.set_focus(self._composer)
         
         # Show empty state if transcript is empty
-        transcript = self.query_one(TranscriptPane)
-        if not transcript.card_children():
+        transcript = self._transcript
+        if transcript.is_empty:
             transcript.show_empty_state()
 
     async def _check_provider_health(self) -> None:
         try:
             models = await self.provider.get_available_models()
             if not models:
-                transcript = self.query_one(TranscriptPane)
+                transcript = self._transcript
                 transcript.add_system_message(
                     "No models found in Ollama. Run: ollama pull llama3",
                     level="warning"
                 )
             keep_alive = getattr(self.provider, "keep_alive", None)
             if keep_alive == 0:
-                transcript = self.query_one(TranscriptPane)
+                transcript = self._transcript
                 transcript.add_system_message(
                     "keep_alive=0 — model reloads from disk every request. "
                     "Set keep_alive=-1 in config.toml for faster responses.",
@@ -615,7 +649,7 @@ class CodeApp(App):
                 )
         except Exception as e:
             logger.warning("Provider health check failed: %s", e)
-            transcript = self.query_one(TranscriptPane)
+            transcript = self._transcript
             transcript.add_system_message(
                 f"Cannot reach LLM provider ({e}). Is it running?",
                 level="warning"
@@ -631,7 +665,7 @@ class CodeApp(App):
     def _update_activity_elapsed(self) -> None:
         """Update activity bar elapsed time periodically."""
         try:
-            activity_bar = self.query_one(PinnedActivityBar)
+            activity_bar = self._activity_bar
             activity_bar.tick_elapsed()
         except Exception:
             pass
@@ -641,7 +675,7 @@ class CodeApp(App):
             models = await self.provider.get_available_models()
             if models:
                 new_model = models[0]
-                header = self.query_one(CodenticHeader)
+                header = self._header
                 if header.model != new_model:
                     header.model = new_model
                     self._sync_header()
@@ -671,7 +705,7 @@ class CodeApp(App):
 
     def _sync_header(self) -> None:
         """Update header with current state."""
-        header = self.query_one(CodenticHeader)
+        header = self._header
         header.mode = self.safety_state.value
         header.model = getattr(self.provider, "model", "unknown")
         header.branch = self._current_branch()
@@ -682,8 +716,7 @@ class CodeApp(App):
         header.is_active = self._processing or self._thinking
         
         # Update tokens/sec (throttled)
-        import time
-        now = time.time()
+        now = time.monotonic()
         if self._stream_start_time > 0 and now - self._last_tokens_per_sec_update > 0.5:
             elapsed = now - self._stream_start_time
             if elapsed > 0:
@@ -724,7 +757,7 @@ class CodeApp(App):
         event.input.value = ""
 
         self._processing = True
-        transcript = self.query_one(TranscriptPane)
+        transcript = self._transcript
         
         # Remove empty state if present
         transcript.remove_empty_state()
@@ -736,12 +769,11 @@ class CodeApp(App):
         self._thinking = True
         
         # Reset streaming metrics
-        import time
-        self._stream_start_time = time.time()
+        self._stream_start_time = time.monotonic()
         self._tokens_received = 0
         
         # Start activity bar
-        activity_bar = self.query_one(PinnedActivityBar)
+        activity_bar = self._activity_bar
         activity_bar.start_activity("Processing request...")
         
         await self.event_bus.publish(self._event("status", {"status": "processing"}, "ui"))
@@ -767,7 +799,8 @@ class CodeApp(App):
         4. Handles streaming chunks (text deltas) and tool results.
         5. Updates context/status on completion.
         """
-        logger.info("process() started: %s", text[:80])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("process() started: %s", text[:80])
         try:
             async for chunk in self.agent.run(text):
                 if hasattr(chunk, "text") and chunk.text:
@@ -815,7 +848,7 @@ class CodeApp(App):
         Periodically drain events from the UIEventBus and update UI components.
 
         Handles:
-        - "message": Appends text to the assistant's response stream (throttled).
+        - "message": Appends text to the streaming card, which batches its own redraws.
         - "tool_result": Adds tool execution cards to the transcript and updates the inspector.
         - "stream_end": Finalizes the current streaming response.
         - "status": Updates activity bar and header.
@@ -827,25 +860,25 @@ class CodeApp(App):
             if not events:
                 return
 
-            transcript = self.query_one(TranscriptPane)
-            inspector = self.query_one(InspectorDrawer)
-            activity_bar = self.query_one(PinnedActivityBar)
+            transcript = self._transcript
+            inspector = self._inspector
+            activity_bar = self._activity_bar
 
             for event in events:
                 if event.type == "message":
                     if event.payload.get("role") == "assistant":
                         delta = event.payload.get("delta", "")
-                        self._tokens_received += len(delta.split())  # Rough token count
+                        # Each streamed delta is ~one token; the bus merges runs of them
+                        self._tokens_received += event.payload.get("chunks", 1)
                         if self._thinking and self._stream_card:
                             self._thinking = False
-                        self._stream_buffer += delta
                         if self._stream_card is None:
                             self._stream_card = transcript.add_message("assistant", "")
                             self._stream_card.start_streaming()
                             self._active_card = self._stream_card
+                        self._stream_card.append(delta)
 
                 elif event.type == "tool_result":
-                    self._flush_stream_buffer(transcript)
                     tool_name = event.payload.get("tool_name", "tool")
                     content = event.payload.get("content", "")
                     is_error = event.payload.get("is_error", False)
@@ -858,6 +891,10 @@ class CodeApp(App):
                         inspector.append_log(f"\n--- SYSTEM ERROR ---\n{content}\n")
                         continue
                     
+                    # The text stream before this tool call is finished
+                    if self._stream_card:
+                        self._stream_card.stop_streaming()
+
                     # Add tool result card
                     card = transcript.add_tool_result(tool_name, arguments, content, is_error)
                     self._active_card = card
@@ -876,7 +913,6 @@ class CodeApp(App):
                     inspector.append_log(f"\n--- TOOL: {tool_name} ---\n{content}\n")
 
                 elif event.type == "stream_end":
-                    self._flush_stream_buffer(transcript)
                     if self._stream_card:
                         self._stream_card.stop_streaming()
                     self._stream_card = None
@@ -910,13 +946,6 @@ class CodeApp(App):
         except Exception:
             logger.exception("_drain_events failed")
 
-    def _flush_stream_buffer(self, transcript: TranscriptPane) -> None:
-        """Flush stream buffer to card (throttled by card's append method)."""
-        if self._stream_card and self._stream_buffer:
-            self._stream_card.append(self._stream_buffer)
-            self._stream_buffer = ""
-            # Only scroll if user is at bottom (handled by TranscriptPane)
-
     def _fail_streaming(self, error_text: str) -> None:
         """Mark the active streaming card as error and append error text."""
         if self._stream_card:
@@ -926,23 +955,10 @@ class CodeApp(App):
         self._stream_card = None
         self._thinking = False
 
-    async def _flush_stream(self) -> None:
-        """Periodically flush stream buffer."""
-        try:
-            if not self._stream_buffer or not self._stream_card:
-                return
-            transcript = self.query_one(TranscriptPane)
-            self._flush_stream_buffer(transcript)
-        except Exception:
-            logger.exception("_flush_stream failed")
-
     async def action_clear_transcript(self) -> None:
         """Clear conversation history with confirmation modal (bound to Ctrl+L)"""
-        transcript = self.query_one(TranscriptPane)
-        # Count cards (excluding empty state)
-        from .cards import EmptyStateCard
-        cards = [c for c in transcript.card_children() if not isinstance(c, EmptyStateCard)]
-        message_count = len(cards)
+        transcript = self._transcript
+        message_count = transcript.card_count
 
         if message_count == 0:
             return
@@ -952,7 +968,6 @@ class CodeApp(App):
         if confirmed:
             transcript.clear_cards()
             transcript.show_empty_state()
-            self._stream_buffer = ""
             self._stream_card = None
             self._thinking = False
 
@@ -962,59 +977,51 @@ class CodeApp(App):
             await self._execute_palette_command(selection)
 
     async def _execute_palette_command(self, command_id: str) -> None:
-        if command_id == "toggle_mode":
-            await self.action_toggle_mode()
-        elif command_id == "clear_transcript":
-            self.action_clear_transcript()
-        elif command_id == "focus_navigator":
-            self.action_focus_navigator()
-        elif command_id == "focus_transcript":
-            self.action_focus_transcript()
-        elif command_id == "focus_inspector":
-            self.action_focus_inspector()
-        elif command_id == "focus_composer":
-            self.action_focus_composer()
-        elif command_id == "toggle_output":
-            self.action_toggle_output()
-            self.action_focus_composer()
-        elif command_id == "show_help":
-            # Help functionality can be added later if needed
-            pass
+        handler = self._palette_dispatch.get(command_id)
+        if handler is None:
+            return
+        result = handler()
+        if asyncio.iscoroutine(result):
+            await result
+
+    def _palette_toggle_output(self) -> None:
+        self.action_toggle_output()
+        self.action_focus_composer()
 
     def action_focus_rail(self) -> None:
         """Focus the left rail (bound to Ctrl+1)."""
-        rail = self.query_one(LeftRail)
+        rail = self._rail
         rail.focus()
     
     def action_toggle_rail(self) -> None:
         """Toggle rail expansion (bound to Ctrl+B)."""
-        rail = self.query_one(LeftRail)
+        rail = self._rail
         rail.toggle()
     
     def action_focus_navigator(self) -> None:
         # Navigator is now part of LeftRail
-        rail = self.query_one(LeftRail)
+        rail = self._rail
         rail.focus()
 
     # Note: action_focus_next and action_focus_previous are inherited from textual.app.App
     # They call self.screen.focus_next() and self.screen.focus_previous() respectively
 
     def action_focus_transcript(self) -> None:
-        transcript = self.query_one(TranscriptPane)
+        transcript = self._transcript
         transcript.focus()
 
     def action_focus_inspector(self) -> None:
-        inspector = self.query_one(InspectorDrawer)
+        inspector = self._inspector
         if not inspector._visible:
             inspector.show()
         inspector.focus()
 
     def action_focus_composer(self) -> None:
-        self.query_one("#composer-input", Input).focus()
+        self._composer.focus()
 
 
     def action_toggle_output(self) -> None:
-        pane = self.query_one(CodeOutputPane)
+        pane = self._output_pane
         pane.toggle()
         if pane.has_class("expanded"):
             pane.focus()
@@ -1037,42 +1044,43 @@ class CodeApp(App):
     def on_card_selected(self, message: CardSelected) -> None:
         """Handle card selection - sets active card, updates inspector if already open."""
         self._active_card = message.card
-        inspector = self.query_one(InspectorDrawer)
+        inspector = self._inspector
 
         # Only update inspector content if it's already visible
         # Don't auto-open it on every card click
         if not inspector._visible:
             return
 
-        from .cards import ToolResultCard, ToolCallCard
-        if isinstance(message.card, (ToolResultCard, ToolCallCard)):
-            inspector.show_tool(
-                message.card.tool_name,
-                getattr(message.card, "arguments", None),
-                getattr(message.card, "content", ""),
-            )
-        elif isinstance(message.card, DiffCard):
-            inspector.show_diff(message.card._full_diff)
+        card = message.card
+        if isinstance(card, (ToolResultCard, ToolCallCard)):
+            inspector.show_tool(card.tool_name, card.arguments, card.content)
+        elif isinstance(card, DiffCard):
+            inspector.show_diff(card._full_diff)
         else:
             inspector.show_context(self._pinned_files, self._context_pct())
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
-        """Global right-click prevention - stop propagation for button 3."""
-        # If you want to kill right-click (or non-left clicks), stop them here.
-        if event.button != 1:  # Not left-click
+        """Global right-click prevention - stop propagation for non-left buttons."""
+        if event.button != _LEFT_BUTTON:
             event.stop()
-            return
-        # Do NOT call super().on_mouse_down; App has no such method.
-        # Allow normal propagation by doing nothing.
-        return
     
     def on_file_pin_message(self, message: FilePinMessage) -> None:
         """Handle file pin message."""
         path = message.path
         if str(path) not in self._pinned_files:
             self._pinned_files.append(str(path))
-        inspector = self.query_one(InspectorDrawer)
-        inspector.show_context(self._pinned_files, self._context_pct())
+        self._schedule_ui_sync()
+
+    def _schedule_ui_sync(self) -> None:
+        """Refresh inspector context and header once after a burst of pins is handled."""
+        if self._pending_ui_sync:
+            return
+        self._pending_ui_sync = True
+        self.call_later(self._do_ui_sync)
+
+    def _do_ui_sync(self) -> None:
+        self._pending_ui_sync = False
+        self._inspector.show_context(self._pinned_files, self._context_pct())
         self._sync_header()
 
     def _event(self, event_type: str, payload: dict, source: str) -> UIEvent:
@@ -2,23 +2,243 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 import json
-
+import platform
+import re
+import shutil
+from typing import Callable
+
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 from rich.console import RenderableType
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.syntax import Syntax, SyntaxTheme
 from rich.text import Text
 from textual import events
 from textual.binding import Binding
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static
 from textual.containers import Container, Vertical
 
 from .theme import COLORS, HUD, get_icon
 
+_PANEL_STYLE = f"on {COLORS['panel']}"
+_LANG_TAG_STYLE = f"on {COLORS['panel_raised']} {COLORS['text']}"
+_ACCENT_BOLD = f"bold {COLORS['accent_cyan']}"
+
+# Shared Panel options for transcript cards and code blocks
+_CARD_PANEL = {"title_align": "left", "box": HUD, "padding": (0, 0), "style": _PANEL_STYLE}
+_CODE_BLOCK_PANEL = {
+    "title_align": "left",
+    "border_style": COLORS["border"],
+    "box": HUD,
+    "padding": (0, 1),
+    "style": _PANEL_STYLE,
+}
+
+# Tool status badge colours - cyan only for active/streaming
+_TOOL_STATUS_COLORS = {
+    "pending": COLORS["accent_orange"],
+    "approved": COLORS["border"],  # Neutral when approved but not running
+    "running": COLORS["accent_cyan"],
+    "ok": COLORS["success"],
+    "error": COLORS["danger"],
+}
+
+# Agent status -> (icon name, label, colour); icons resolve at build time (config-dependent)
+_AGENT_STATUS = {
+    "streaming": ("spinner", "STREAMING", COLORS["accent_cyan"]),
+    "error": ("error", "ERROR", COLORS["danger"]),
+}
+_AGENT_STATUS_DONE = ("done", "DONE", COLORS["border"])
+
+# System card level -> (colour, label)
+_SYSTEM_LEVELS = {
+    "warning": (COLORS["accent_orange"], "WARNING"),
+    "error": (COLORS["danger"], "ERROR"),
+}
+_SYSTEM_LEVEL_INFO = (COLORS["text_muted"], "INFO")
+
+_CODE_FENCE = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
+_NON_SPACE = re.compile(r'\S')
+# Anything that could make Markdown render differently from the raw text: inline
+# markup, entities, line-leading block syntax, soft line breaks and indentation
+_MARKDOWN_SYNTAX = re.compile(
+    r'[`*_#\[\]<>&\\|~]|^\s*(?:[-+=]|\d+[.)])|(?<!\n)\n(?!\n)|\n\n\n|\n[ \t]',
+    re.MULTILINE,
+)
+
+
+def _detect_clipboard_command() -> list[str] | None:
+    """Pick the system clipboard tool once, at import."""
+    if platform.system() == "Darwin":
+        return ["pbcopy"]
+    for cmd in (["wl-copy"], ["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]):
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+
+_CLIP_CMD = _detect_clipboard_command()
+
+# Pygments gets very slow on huge blocks; show those as plain text instead
+_HIGHLIGHT_MAX_BYTES = 50_000
+
+# Card states that carry a matching CSS class
+_STATUS_CLASSES = frozenset({"streaming", "error", "warning", "success"})
+
+
+def _line_cut(text: str, limit: int) -> int | None:
+    """End of line ``limit`` when ``text`` has more lines, scanning only that far."""
+    idx = -1
+    for _ in range(limit):
+        idx = text.find("\n", idx + 1)
+        if idx == -1:
+            return None
+    return idx if idx < len(text) - 1 else None
+
+
+def _more_lines_than(text: str, limit: int) -> bool:
+    """``len(text.splitlines()) > limit`` without splitting the whole text."""
+    return _line_cut(text, limit) is not None
+
+
+def _truncate_lines(text: str, limit: int) -> str:
+    """Keep the first ``limit`` lines, scanning only as far as the cut point."""
+    cut = _line_cut(text, limit)
+    return text if cut is None else text[:cut] + "\n..."
+
+
+def _strip_span(content: str, start: int, end: int) -> str:
+    """``content[start:end].strip()``, trimmed in place so only one slice is made."""
+    first = _NON_SPACE.search(content, start, end)
+    if first is None:
+        return ""
+    while content[end - 1].isspace():
+        end -= 1
+    return content[first.start():end]
+
+
+def _scan_code_blocks(content: str, start: int) -> tuple[list, int]:
+    """Split ``content[start:]`` into text/code parts up to the last closed code block.
+
+    Returns the parts and the offset just past that block. Text after it is left
+    for the caller, since more streamed text may still turn it into code.
+    """
+    parts = []
+    last_end = start
+    # Most streamed prefixes hold no fence yet; skip the regex machinery for them
+    if content.find("```", start) == -1:
+        return parts, last_end
+    for match in _CODE_FENCE.finditer(content, start):
+        # Text before code block
+        if match.start() > last_end:
+            text_before = _strip_span(content, last_end, match.start())
+            if text_before:
+                parts.append(("text", text_before))
+
+        # Code block
+        language = match.group(1) or "text"
+        code = _strip_span(content, match.start(2), match.end(2))
+        parts.append(("code", language, code))
+
+        last_end = match.end()
+    return parts, last_end
+
+
+def _finish_parts(parts: list, content: str, last_end: int) -> list:
+    """Append the text after the last code block to ``parts``."""
+    # Text after last code block
+    if last_end < len(content):
+        text_after = _strip_span(content, last_end, len(content))
+        if text_after:
+            parts.append(("text", text_after))
+
+    return parts if parts else [("text", content)]
+
+
+@lru_cache(maxsize=256)
+def _markdown_for(text: str) -> Markdown:
+    """Shared Markdown for a settled text block; parsing happens in the constructor."""
+    return Markdown(text)
+
+
+async def _copy_to_clipboard(widget: Widget, text: str) -> None:
+    """Copy ``text`` with the system clipboard tool, or via the terminal (OSC 52) without one.
+
+    A tool that fails once (missing binary, no display) is dropped for the rest of the
+    session, so later copies go straight to OSC 52 instead of spawning it again.
+    """
+    global _CLIP_CMD
+    if _CLIP_CMD is not None:
+        try:
+            # Output goes to DEVNULL: xclip forks a selection owner that would hold a pipe open
+            proc = await asyncio.create_subprocess_exec(
+                *_CLIP_CMD,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await proc.communicate(text.encode())
+        except OSError:
+            proc = None
+        if proc is None or proc.returncode != 0:
+            _CLIP_CMD = None
+    if _CLIP_CMD is None:
+        widget.app.copy_to_clipboard(text)
+    widget.app.notify("Copied to clipboard", severity="information")
+
+
+@lru_cache(maxsize=64)
+def _lexer(name: str) -> Lexer:
+    """Shared Pygments lexer; given a name, Syntax looks one up again on every render."""
+    try:
+        return get_lexer_by_name(name, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return _lexer("text")
+
+
+@lru_cache(maxsize=None)
+def _syntax_theme(name: str) -> SyntaxTheme:
+    """Shared syntax theme, resolved once instead of per Syntax object."""
+    return Syntax.get_theme(name)
+
+
+@lru_cache(maxsize=256)
+def _syntax_for(code: str, language: str) -> Syntax:
+    """Shared Syntax for a fenced code block.
+
+    Message cards re-create code block widgets when their content is rebuilt (for
+    example on collapse); blocks with identical text get the same renderable.
+    """
+    return Syntax(
+        code,
+        _lexer(language),
+        theme=_syntax_theme("monokai"),
+        word_wrap=True,
+        background_color=COLORS["panel"],
+    )
+
+
+@lru_cache(maxsize=64)
+def _code_block_header(language: str, highlighted: bool) -> Text:
+    """Panel title for a code block; it only depends on the language and highlight mode."""
+    header = Text()
+    header.append(f" {language} ", style=_LANG_TAG_STYLE)
+    header.append("  ", style=COLORS["text_muted"])
+    header.append("[c]", style=_ACCENT_BOLD)
+    header.append("opy", style=COLORS["text_muted"])
+    if not highlighted:
+        header.append("  (large block, not highlighted)", style=COLORS["text_muted"])
+    return header
+
 
 class CodeBlockWidget(Widget):
     """Syntax-highlighted code block with copy affordance."""
@@ -33,40 +253,58 @@ class CodeBlockWidget(Widget):
         super().__init__(**kwargs)
         self.code = code
         self.language = language
+        self._highlight = len(code) <= _HIGHLIGHT_MAX_BYTES
 
     def render(self) -> RenderableType:
-        # Header with language and copy hint
-        header = Text()
-        header.append(f" {self.language} ", style=f"on {COLORS['panel_raised']} {COLORS['text']}")
-        header.append("  ", style=COLORS["text_muted"])
-        header.append("[c]", style=f"bold {COLORS['accent_cyan']}")
-        header.append("opy", style=COLORS["text_muted"])
+        if self._highlight:
+            body = _syntax_for(self.code, self.language)
+        else:
+            body = Text(self.code, style=COLORS["text"])
 
         return Panel(
-            Syntax(self.code, self.language, theme="monokai", word_wrap=True, background_color=COLORS["panel"]),
-            title=header,
-            title_align="left",
-            border_style=COLORS["border"],
-            box=HUD,
-            padding=(0, 1),
-            style=f"on {COLORS['panel']}",
+            body,
+            title=_code_block_header(self.language, self._highlight),
+            **_CODE_BLOCK_PANEL,
         )
 
-    def action_copy_code(self) -> None:
+    async def action_copy_code(self) -> None:
         """Copy code to clipboard."""
-        import subprocess
-        import platform
-        try:
-            if platform.system() == "Darwin":
-                subprocess.run(["pbcopy"], input=self.code.encode(), check=True)
-            else:
-                subprocess.run(["xclip", "-selection", "clipboard"], input=self.code.encode(), check=True)
-            self.app.notify("Copied to clipboard", severity="information")
-        except Exception:
-            self.app.notify("Copy failed - clipboard unavailable", severity="warning")
+        await _copy_to_clipboard(self, self.code)
+
+
+class _CardMixin:
+    """Behaviour shared by BaseCard and AgentMessageCard.
+
+    Textual only collects BINDINGS from DOM classes, so each card still declares
+    its own copy binding.
+    """
+
+    _status_class: str | None = None
+
+    def _truncate(self, text: str, limit: int = 14) -> str:
+        return _truncate_lines(text, limit)
+
+    def _update_status_class(self, status: str) -> None:
+        """Update CSS class based on status, touching the class set only on a change."""
+        status_class = status if status in _STATUS_CLASSES else None
+        if status_class == self._status_class:
+            return
+        if self._status_class is not None:
+            self.remove_class(self._status_class)
+        if status_class is not None:
+            self.add_class(status_class)
+        self._status_class = status_class
+
+    async def action_copy_content(self) -> None:
+        """Copy card content to clipboard."""
+        await _copy_to_clipboard(self, self.content)
+
+    def on_click(self, event: events.Click) -> None:
+        from .widgets import CardSelected
+        self.post_message(CardSelected(self))
 
 
-class BaseCard(Widget):
+class BaseCard(_CardMixin, Widget):
     """Base card component with common functionality."""
 
     can_focus = True
@@ -82,41 +320,41 @@ class BaseCard(Widget):
         self.title = title
         self.content = content
         self.timestamp = datetime.now()
-
-    def _truncate(self, text: str, limit: int = 14) -> str:
-        lines = text.splitlines()
-        if len(lines) <= limit:
-            return text
-        return "\n".join(lines[:limit]) + "\n..."
+        self._time_str = self.timestamp.strftime("%H:%M")
+        self._syntax_cache: tuple[str, str, Syntax] | None = None
+        self._memo_cache: dict[str, tuple[tuple, object]] = {}
+
+    def _memo(self, name: str, key: tuple, build: Callable[[], object]) -> object:
+        """Return the value last built under ``name``, rebuilding it only when ``key`` changes."""
+        cached = self._memo_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build()
+        self._memo_cache[name] = (key, value)
+        return value
+
+    def _syntax(self, body: str, lexer: str) -> Syntax:
+        """Return a Syntax for ``body``, reusing the last one while the text is unchanged."""
+        cached = self._syntax_cache
+        if cached is not None and cached[0] == body and cached[1] == lexer:
+            return cached[2]
+        syntax = Syntax(body, _lexer(lexer), theme=_syntax_theme("code_neon"), word_wrap=True)
+        self._syntax_cache = (body, lexer, syntax)
+        return syntax
+
+    def _highlighted(self, body: str, lexer: str) -> RenderableType:
+        """Syntax-highlight ``body`` when expanded; collapsed previews stay plain text."""
+        if self.collapsed:
+            return Text(body, style=COLORS["text_muted"])
+        if lexer == "text":
+            # Pygments' text lexer emits no token styles, so skip it entirely
+            return Text(body, style=COLORS["text"], tab_size=4)
+        return self._syntax(body, lexer)
 
     def toggle_collapse(self) -> None:
         self.collapsed = not self.collapsed
         self.refresh(layout=True)
 
-    def _update_status_class(self, status: str) -> None:
-        """Update CSS class based on status."""
-        self.remove_class("streaming", "error", "warning", "success")
-        if status in ("streaming", "error", "warning", "success"):
-            self.add_class(status)
-
-    def action_copy_content(self) -> None:
-        """Copy card content to clipboard."""
-        import subprocess
-        import platform
-        try:
-            text = self.content
-            if platform.system() == "Darwin":
-                subprocess.run(["pbcopy"], input=text.encode(), check=True)
-            else:
-                subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True)
-            self.app.notify("Copied to clipboard", severity="information")
-        except Exception:
-            self.app.notify("Copy failed - clipboard unavailable", severity="warning")
-
-    def on_click(self, event: events.Click) -> None:
-        from .widgets import CardSelected
-        self.post_message(CardSelected(self))
-
 
 class UserMessageCard(BaseCard):
     """Card for user messages."""
@@ -126,31 +364,29 @@ class UserMessageCard(BaseCard):
         self.role = "user"
     
     def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
-        header = f"USER · {time_str}"
+        return self._memo("panel", (self.content, self.collapsed), self._build_panel)
+
+    def _build_panel(self) -> Panel:
+        header = f"USER · {self._time_str}"
         body = self._truncate(self.content) if self.collapsed else self.content
         return Panel(
             Text(body, style=COLORS["text"]),
             title=header,
-            title_align="left",
             border_style=COLORS["border"],
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
-class AgentMessageCard(Container):
+class AgentMessageCard(_CardMixin, Container):
     """Card for agent messages with streaming support and focusable code blocks."""
 
     can_focus = True
     collapsed = reactive(False)
-    content = reactive("")
-    _streaming = reactive(False)
-    _status = reactive("done")  # streaming, done, error
-    _stream_buffer = ""
-    _last_render_time = 0.0
+    # Plain attributes: status changes are pushed to the header and CSS classes explicitly
+    _streaming = False
+    _status = "done"  # streaming, done, error
     _render_throttle_ms = 33  # ~30 fps
+    _collapsed_limit = 14  # Lines shown when collapsed
     _content_container = None
 
     BINDINGS = [
@@ -160,12 +396,28 @@ class AgentMessageCard(Container):
     def __init__(self, content: str = "", **kwargs: object) -> None:
         super().__init__(**kwargs)
         self.role = "assistant"
-        self.content = content
+        self._content_parts: list[str] = [content] if content else []
+        self._content_len = len(content)
+        self._newline_count = content.count("\n")
+        self._render_stale = False
         self._streaming = False
         self._status = "done"
-        self._stream_buffer = ""
-        self._last_render_time = 0.0
+        self._stream_chunks: list[str] = []
+        self._flush_timer: Timer | None = None
+        # Parsed parts keyed by (collapsed, len(content)); content only grows while streaming
+        self._parse_cache_key: tuple[bool, int] | None = None
+        self._parse_cache: list = []
+        # Parts before the last closed code block never change as content grows
+        self._stable_parts: list = []
+        self._parsed_prefix_end = 0
+        # Blocks currently mounted in the content container, and their widgets
+        self._mounted_blocks: list[tuple] = []
+        self._block_widgets: list[Widget] = []
+        # Text widgets showing streamed prose as plain Text, upgraded once streaming ends
+        self._plain_widgets: set[Widget] = set()
         self.timestamp = datetime.now()
+        self._time_str = self.timestamp.strftime("%H:%M")
+        self._header_cache: tuple[str, Text] | None = None
         self.title = "AGENT"
         self._content_container = None
 
@@ -182,80 +434,181 @@ class AgentMessageCard(Container):
         """After mount, populate the content container with parsed content."""
         self._content_container = self.query_one("#agent-content", Vertical)
         self._rebuild_content()
+        if self._streaming:
+            self._start_flush_timer()
 
     def _rebuild_content(self) -> None:
-        """Rebuild the content container's children."""
+        """Bring the content container's children in line with the parsed content.
+
+        Children for the leading blocks that did not change are kept as they are.
+        A trailing text block that only grew is updated in place; anything after
+        the first difference is removed and mounted again.
+        """
         if not self._content_container:
             return
-
-        # Clear existing content children
-        self._content_container.remove_children()
-
-        # Parse and mount new children
-        body_content = self._truncate(self.content) if self.collapsed else self.content
-        parts = self._parse_content_with_code_blocks(body_content)
-
+        self._render_stale = False
+
+        blocks = self._content_blocks()
+        mounted = self._mounted_blocks
+        widgets = self._block_widgets
+
+        keep = 0
+        shared = min(len(blocks), len(mounted))
+        while keep < shared and blocks[keep] == mounted[keep]:
+            keep += 1
+        if keep < shared and blocks[keep][0] == "text" and mounted[keep][0] == "text":
+            # Still-growing text: parse directly rather than filling the shared cache
+            text = blocks[keep][1]
+            if self._streaming and _MARKDOWN_SYNTAX.search(text) is None:
+                # Plain prose looks the same without a Markdown parse on every tick
+                widgets[keep].update(Text(text))
+                self._plain_widgets.add(widgets[keep])
+            else:
+                widgets[keep].update(Markdown(text))
+                self._plain_widgets.discard(widgets[keep])
+            keep += 1
+
+        new_widgets = [self._block_widget(block) for block in blocks[keep:]]
+        if keep < len(widgets) or new_widgets:
+            # One screen update for the swap, not one for the removal and one for the mount
+            with self.app.batch_update():
+                if keep < len(widgets):
+                    self._content_container.remove_children(widgets[keep:])
+                if new_widgets:
+                    self._content_container.mount(*new_widgets)
+
+        self._mounted_blocks = blocks
+        self._block_widgets = widgets[:keep] + new_widgets
+        if self._plain_widgets:
+            self._upgrade_plain_widgets()
+
+    def _upgrade_plain_widgets(self) -> None:
+        """Swap plain-Text previews for Markdown once they are settled or streaming ended."""
+        streaming = self._streaming
+        last = len(self._block_widgets) - 1
+        for index, (block, widget) in enumerate(zip(self._mounted_blocks, self._block_widgets)):
+            if widget in self._plain_widgets and not (streaming and index == last):
+                widget.update(_markdown_for(block[1]))
+                self._plain_widgets.discard(widget)
+        # Widgets removed from the container no longer need upgrading
+        self._plain_widgets.intersection_update(self._block_widgets)
+
+    def _content_blocks(self) -> list[tuple]:
+        """Parsed content as the list of blocks to show, one child widget each."""
+        parts = self._parsed_parts()
         if not parts or (len(parts) == 1 and parts[0][0] == "text" and not parts[0][1]):
             # Empty or no content
-            if self._status == "streaming":
-                self._content_container.mount(Static(Markdown("*Thinking...*"), classes="agent-card-text"))
+            return [("thinking",)] if self._status == "streaming" else [("blank",)]
+        return [part for part in parts if part[0] == "code" or part[1]]
+
+    @staticmethod
+    def _block_widget(block: tuple) -> Widget:
+        kind = block[0]
+        if kind == "code":
+            return CodeBlockWidget(block[2], block[1], classes="agent-card-code")
+        if kind == "text":
+            return Static(_markdown_for(block[1]), classes="agent-card-text")
+        if kind == "thinking":
+            return Static(Markdown("*Thinking...*"), classes="agent-card-text")
+        return Static("", classes="agent-card-text")
+
+    @property
+    def content(self) -> str:
+        """Full message text, joined from the streamed parts.
+
+        The join is kept: parts collapse into one string, so reading again before
+        the next flush costs nothing and the next join starts from that string.
+        """
+        parts = self._content_parts
+        if len(parts) > 1:
+            parts[:] = ["".join(parts)]
+        return parts[0] if parts else ""
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content_parts = [value] if value else []
+        self._content_len = len(value)
+        self._newline_count = value.count("\n")
+        self._parse_cache_key = None
+        self._stable_parts = []
+        self._parsed_prefix_end = 0
+
+    def _parsed_parts(self) -> list:
+        """Return parsed content parts, re-parsing only when content or collapse state changed."""
+        key = (self.collapsed, self._content_len)
+        if key != self._parse_cache_key:
+            content = self.content
+            if self.collapsed:
+                body_content = self._truncate(content, self._collapsed_limit)
+                self._parse_cache = self._parse_content_with_code_blocks(body_content)
             else:
-                self._content_container.mount(Static("", classes="agent-card-text"))
-        else:
-            children = []
-            for i, part in enumerate(parts):
-                if part[0] == "text":
-                    if part[1]:
-                        children.append(Static(Markdown(part[1]), classes="agent-card-text"))
-                elif part[0] == "code":
-                    lang, code = part[1], part[2]
-                    children.append(CodeBlockWidget(code, lang, classes="agent-card-code"))
-
-            if children:
-                self._content_container.mount(*children)
+                self._parse_cache = self._parse_appended(content)
+            self._parse_cache_key = key
+        return self._parse_cache
+
+    def _parse_appended(self, content: str) -> list:
+        """Parse content, scanning only what follows the last closed code block."""
+        parts, last_end = _scan_code_blocks(content, self._parsed_prefix_end)
+        self._stable_parts.extend(parts)
+        self._parsed_prefix_end = last_end
+        return _finish_parts(list(self._stable_parts), content, last_end)
 
     def _build_header(self) -> Text:
-        """Build the header text with status indicator."""
-        time_str = self.timestamp.strftime("%H:%M")
+        """Build the header text with status indicator (cached until the status changes)."""
+        cached = self._header_cache
+        if cached is not None and cached[0] == self._status:
+            return cached[1]
 
         # Status indicator (compact)
-        if self._status == "streaming":
-            status_icon = get_icon("spinner")
-            status_text = f"{status_icon} STREAMING"
-            status_color = COLORS["accent_cyan"]
-        elif self._status == "error":
-            status_icon = get_icon("error")
-            status_text = f"{status_icon} ERROR"
-            status_color = COLORS["danger"]
-        else:
-            status_icon = get_icon("done")
-            status_text = f"{status_icon} DONE"
-            status_color = COLORS["border"]
+        icon_name, label, status_color = _AGENT_STATUS.get(self._status, _AGENT_STATUS_DONE)
 
         header = Text()
-        header.append(f"AGENT · {status_text} · {time_str}", style=status_color)
+        header.append(f"AGENT · {get_icon(icon_name)} {label} · {self._time_str}", style=status_color)
+        self._header_cache = (self._status, header)
         return header
 
-    def _truncate(self, text: str, limit: int = 14) -> str:
-        lines = text.splitlines()
-        if len(lines) <= limit:
-            return text
-        return "\n".join(lines[:limit]) + "\n..."
-
     def append(self, text: str) -> None:
-        """Append text to stream buffer (throttled rendering)."""
-        self._stream_buffer += text
-        self._throttled_refresh()
-
-    def _throttled_refresh(self) -> None:
-        """Refresh only if enough time has passed (throttle to ~30 fps)."""
-        import time
-        now = time.time()
-        elapsed_ms = (now - self._last_render_time) * 1000
-        if elapsed_ms >= self._render_throttle_ms:
-            self.content += self._stream_buffer
-            self._stream_buffer = ""
-            self._last_render_time = now
+        """Append text to stream buffer (rendered on the next flush tick)."""
+        self._stream_chunks.append(text)
+        if self._flush_timer is not None:
+            self._flush_timer.resume()
+
+    def _start_flush_timer(self) -> None:
+        """Start the ~30 fps flush timer (only once mounted)."""
+        if self._flush_timer is None and self._content_container is not None:
+            self._flush_timer = self.set_interval(self._render_throttle_ms / 1000, self._flush_buffer)
+
+    def _stop_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+
+    def _take_buffer(self) -> bool:
+        """Move buffered chunks into content. Returns True if anything moved."""
+        if not self._stream_chunks:
+            return False
+        text = "".join(self._stream_chunks)
+        self._stream_chunks.clear()
+        self._content_parts.append(text)
+        self._content_len += len(text)
+        self._newline_count += text.count("\n")
+        return True
+
+    def _flush_buffer(self) -> None:
+        """Timer callback: render whatever arrived since the last tick.
+
+        Skips the rebuild while the card is scrolled out of view (it catches up on
+        the first tick it is visible again) and when collapsed past the truncation
+        point, since appended text cannot change the visible lines. The timer pauses
+        itself once there is nothing left to draw; the next append resumes it.
+        """
+        settled = self.collapsed and self._newline_count > self._collapsed_limit
+        if self._take_buffer() and not settled:
+            self._render_stale = True
+        if not self._render_stale:
+            if self._flush_timer is not None:
+                self._flush_timer.pause()
+        elif self.is_on_screen:
             self._rebuild_content()
 
     def start_streaming(self) -> None:
@@ -264,37 +617,32 @@ class AgentMessageCard(Container):
         self._status = "streaming"
         self._update_status_class("streaming")
         self._update_header()
+        self._start_flush_timer()
 
     def stop_streaming(self) -> None:
         """Mark card as done streaming."""
-        # Flush any remaining buffer
-        if self._stream_buffer:
-            self.content += self._stream_buffer
-            self._stream_buffer = ""
+        self._stop_flush_timer()
+        self._take_buffer()
         self._streaming = False
         self._status = "done"
         self._update_status_class("done")
+        self._update_header()
         self._rebuild_content()
 
     def mark_error(self) -> None:
         """Mark card as failed."""
-        # Flush any remaining buffer
-        if self._stream_buffer:
-            self.content += self._stream_buffer
-            self._stream_buffer = ""
+        self._stop_flush_timer()
+        self._take_buffer()
         self._streaming = False
         self._status = "error"
         self._update_status_class("error")
+        self._update_header()
         self._rebuild_content()
 
-    def _update_status_class(self, status: str) -> None:
-        """Update CSS class based on status."""
-        self.remove_class("streaming", "error", "warning", "success")
-        if status in ("streaming", "error", "warning", "success"):
-            self.add_class(status)
-
     def _update_header(self) -> None:
-        """Update just the header widget."""
+        """Update just the header widget, if the status it shows is out of date."""
+        if self._header_cache is not None and self._header_cache[0] == self._status:
+            return
         try:
             header_widget = self.query_one(".agent-card-header", Static)
             if header_widget:
@@ -309,51 +657,8 @@ class AgentMessageCard(Container):
 
     def _parse_content_with_code_blocks(self, content: str) -> list:
         """Parse content and extract code blocks for special rendering."""
-        import re
-
-        parts = []
-        code_pattern = r'```(\w*)\n(.*?)```'
-        last_end = 0
-
-        for match in re.finditer(code_pattern, content, re.DOTALL):
-            # Text before code block
-            if match.start() > last_end:
-                text_before = content[last_end:match.start()].strip()
-                if text_before:
-                    parts.append(("text", text_before))
-
-            # Code block
-            language = match.group(1) or "text"
-            code = match.group(2).strip()
-            parts.append(("code", language, code))
-
-            last_end = match.end()
-
-        # Text after last code block
-        if last_end < len(content):
-            text_after = content[last_end:].strip()
-            if text_after:
-                parts.append(("text", text_after))
-
-        return parts if parts else [("text", content)]
-
-    def action_copy_content(self) -> None:
-        """Copy card content to clipboard."""
-        import subprocess
-        import platform
-        try:
-            text = self.content
-            if platform.system() == "Darwin":
-                subprocess.run(["pbcopy"], input=text.encode(), check=True)
-            else:
-                subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True)
-            self.app.notify("Copied to clipboard", severity="information")
-        except Exception:
-            self.app.notify("Copy failed - clipboard unavailable", severity="warning")
-
-    def on_click(self, event: events.Click) -> None:
-        from .widgets import CardSelected
-        self.post_message(CardSelected(self))
+        parts, last_end = _scan_code_blocks(content, 0)
+        return _finish_parts(parts, content, last_end)
 
 
 class ToolCallCard(BaseCard):
@@ -373,35 +678,41 @@ class ToolCallCard(BaseCard):
         self.arguments = arguments or {}
         self.status = status
         self.duration_ms = duration_ms
+
+    @property
+    def arguments(self) -> dict:
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, value: dict) -> None:
+        self._arguments = value
+        self._args_json_cache: str | None = None
+
+    def _args_json(self) -> str:
+        """Serialized arguments, encoded once per assignment rather than per render."""
+        if self._args_json_cache is None:
+            self._args_json_cache = json.dumps(self._arguments, indent=2)
+        return self._args_json_cache
     
     def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
-        
-        # Status badge - color discipline: cyan only for active/streaming
-        status_colors = {
-            "pending": COLORS["accent_orange"],
-            "approved": COLORS["border"],  # Neutral when approved but not running
-            "running": COLORS["accent_cyan"],
-            "ok": COLORS["success"],
-            "error": COLORS["danger"],
-        }
-        status_color = status_colors.get(self.status, COLORS["text_muted"])
+        key = (self.status, self.duration_ms, self.collapsed, self._args_json())
+        return self._memo("panel", key, self._build_panel)
+
+    def _build_panel(self) -> Panel:
+        status_color = _TOOL_STATUS_COLORS.get(self.status, COLORS["text_muted"])
         
         duration_text = f" · {self.duration_ms}ms" if self.duration_ms else ""
-        header = f"{self.tool_name.upper()} · {self.status.upper()}{duration_text} · {time_str}"
+        header = f"{self.tool_name.upper()} · {self.status.upper()}{duration_text} · {self._time_str}"
         
-        args_json = json.dumps(self.arguments, indent=2)
+        args_json = self._args_json()
         body_text = f"ARGS:\n{args_json}"
         body = self._truncate(body_text, limit=18) if self.collapsed else body_text
         
         return Panel(
-            Syntax(body, "json", theme="code_neon", word_wrap=True),
+            self._highlighted(body, "json"),
             title=header,
-            title_align="left",
             border_style=status_color,
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -423,26 +734,22 @@ class ToolResultCard(BaseCard):
         self.is_error = is_error
     
     def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
         status = "ERROR" if self.is_error else "OK"
         status_color = COLORS["danger"] if self.is_error else COLORS["success"]
         
-        header = f"{self.tool_name.upper()} · {status} · {time_str}"
+        header = f"{self.tool_name.upper()} · {status} · {self._time_str}"
         body = self._truncate(self.content, limit=18) if self.collapsed else self.content
 
         if self.is_error:
             renderable = Text(body, style=COLORS["danger"])
         else:
-            renderable = Syntax(body, "text", theme="code_neon", word_wrap=True)
+            renderable = self._highlighted(body, "text")
 
         return Panel(
             renderable,
             title=header,
-            title_align="left",
             border_style=status_color,
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -453,38 +760,43 @@ class DiffCard(BaseCard):
         super().__init__("DIFF", diff_text, **kwargs)
         self.file_path = file_path
         self._full_diff = diff_text
-    
-    def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
-        diff_icon = get_icon("diff")
-        
-        header = f"{diff_icon} DIFF"
-        if self.file_path:
-            header += f" · {self.file_path}"
-        header += f" · {time_str}"
-        
-        # Show summary when collapsed
-        if self.collapsed:
-            lines = self._full_diff.splitlines()
-            summary = f"{len(lines)} lines changed"
-            if lines:
+        self._collapsed_summary: str | None = None
+
+    def _summary(self) -> str:
+        """Collapsed preview of the diff, built on first use and then reused."""
+        if self._collapsed_summary is None:
+            diff = self._full_diff
+            # Count lines without materializing them; only the first five are previewed
+            line_count = diff.count("\n") + (bool(diff) and not diff.endswith("\n"))
+            summary = f"{line_count} lines changed"
+            if diff:
                 # Show first few changed lines
-                preview_lines = [l for l in lines[:5] if l.startswith(("+", "-"))]
+                head = diff.split("\n", 5)[:5]
+                preview_lines = [l for l in head if l.startswith(("+", "-"))]
                 summary += "\n" + "\n".join(preview_lines[:3])
                 if len(preview_lines) > 3:
                     summary += "\n..."
-            body = summary
-        else:
-            body = self._full_diff
+            self._collapsed_summary = summary
+        return self._collapsed_summary
+    
+    def _build_header(self) -> str:
+        header = f"{get_icon('diff')} DIFF"
+        if self.file_path:
+            header += f" · {self.file_path}"
+        return header + f" · {self._time_str}"
+
+    def render(self) -> RenderableType:
+        # get_icon reads the config, so the title is only rebuilt when it can change
+        header = self._memo("header", (self.file_path,), self._build_header)
+
+        # Show summary when collapsed
+        body = self._summary() if self.collapsed else self._full_diff
         
         return Panel(
-            Syntax(body, "diff", theme="code_neon", word_wrap=True),
+            self._highlighted(body, "diff"),
             title=header,
-            title_align="left",
             border_style=COLORS["border"],  # Neutral border - cyan only for active/focus
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -496,11 +808,11 @@ class ErrorCard(BaseCard):
         self.details = details
     
     def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
-        error_icon = get_icon("error")
-        
-        header = f"{error_icon} ERROR · {time_str}"
-        
+        return self._memo("panel", (self.content, self.details, self.collapsed), self._build_panel)
+
+    def _build_panel(self) -> Panel:
+        header = f"{get_icon('error')} ERROR · {self._time_str}"
+
         body = self.content
         if self.details and not self.collapsed:
             body += f"\n\nDETAILS:\n{self.details}"
@@ -510,11 +822,8 @@ class ErrorCard(BaseCard):
         return Panel(
             Text(body, style=COLORS["danger"]),
             title=header,
-            title_align="left",
             border_style=COLORS["danger"],
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -526,29 +835,18 @@ class SystemCard(BaseCard):
         self.level = level  # info, warning, error
 
     def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
-
-        if self.level == "warning":
-            level_color = COLORS["accent_orange"]
-            level_text = "WARNING"
-        elif self.level == "error":
-            level_color = COLORS["danger"]
-            level_text = "ERROR"
-        else:
-            level_color = COLORS["text_muted"]
-            level_text = "INFO"
+        return self._memo("panel", (self.content, self.level, self.collapsed), self._build_panel)
 
-        header = f"SYSTEM · {level_text} · {time_str}"
+    def _build_panel(self) -> Panel:
+        level_color, level_text = _SYSTEM_LEVELS.get(self.level, _SYSTEM_LEVEL_INFO)
+        header = f"SYSTEM · {level_text} · {self._time_str}"
         body = self._truncate(self.content) if self.collapsed else self.content
 
         return Panel(
             Text(body, style=COLORS["text"]),
             title=header,
-            title_align="left",
             border_style=level_color,
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -556,18 +854,18 @@ class PlanCard(BaseCard):
     """Card for showing plans."""
 
     def render(self) -> RenderableType:
-        time_str = self.timestamp.strftime("%H:%M")
-        header = f"PLAN · {time_str}"
+        # Markdown parses in its constructor, so keep the panel until the input changes
+        return self._memo("panel", (self.content, self.collapsed), self._build_panel)
+
+    def _build_panel(self) -> Panel:
+        header = f"PLAN · {self._time_str}"
         body = self._truncate(self.content, limit=18) if self.collapsed else self.content
         
         return Panel(
             Markdown(body),
             title=header,
-            title_align="left",
             border_style=COLORS["border"],
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -588,23 +886,19 @@ class PendingToolCallCard(ToolCallCard):
         self.on_reject = on_reject
         self.on_approve_all = on_approve_all
     
-    def render(self) -> RenderableType:
+    def _build_panel(self) -> Panel:
         """Render with action buttons (buttons are handled via click events)."""
-        time_str = self.timestamp.strftime("%H:%M")
-        header = f"{self.tool_name.upper()} · PENDING · {time_str}"
+        header = f"{self.tool_name.upper()} · PENDING · {self._time_str}"
         
-        args_json = json.dumps(self.arguments, indent=2)
+        args_json = self._args_json()
         body_text = f"ARGS:\n{args_json}\n\n[Approve Once] [Approve All Until Idle] [Reject]"
         body = self._truncate(body_text, limit=18) if self.collapsed else body_text
         
         return Panel(
-            Syntax(body, "json", theme="code_neon", word_wrap=True),
+            self._highlighted(body, "json"),
             title=header,
-            title_align="left",
             border_style=COLORS["accent_orange"],
-            box=HUD,
-            padding=(0, 0),
-            style=f"on {COLORS['panel']}",
+            **_CARD_PANEL,
         )
 
 
@@ -618,11 +912,13 @@ class EmptyStateCard(BaseCard):
             "Fix the bug in the login function",
             "Refactor the database connection code",
         ]
-    
-    def render(self) -> RenderableType:
+        # The empty state never changes, so build its panel once
+        self._panel = self._build_panel()
+
+    def _build_panel(self) -> Panel:
         content = Text()
         content.append("Type a request, or press ", style=COLORS["text_muted"])
-        content.append("Ctrl+Shift+P", style=f"bold {COLORS['accent_cyan']}")
+        content.append("Ctrl+Shift+P", style=_ACCENT_BOLD)
         content.append(" for commands\n\n", style=COLORS["text_muted"])
         content.append("Examples:\n", style=COLORS["text"])
         for i, example in enumerate(self.examples, 1):
@@ -635,5 +931,8 @@ class EmptyStateCard(BaseCard):
             border_style=COLORS["border"],
             box=HUD,
             padding=(1, 2),
-            style=f"on {COLORS['panel']}",
+            style=_PANEL_STYLE,
         )
+    
+    def render(self) -> RenderableType:
+        return self._panel
@@ -1,22 +1,56 @@
 from __future__ import annotations
 
-import asyncio
+from collections import deque
+from dataclasses import replace
 
 from code_cli.ui.events import UIEvent
 
 
+def _is_text_delta(event: UIEvent) -> bool:
+    return event.type == "message" and event.payload.get("role") == "assistant" and "delta" in event.payload
+
+
+def _merge_deltas(run: list[UIEvent]) -> UIEvent:
+    """One message event for a run of deltas; ``chunks`` keeps the original count."""
+    if len(run) == 1:
+        return run[0]
+    first = run[0]
+    payload = dict(first.payload)
+    payload["delta"] = "".join(event.payload["delta"] for event in run)
+    payload["chunks"] = sum(event.payload.get("chunks", 1) for event in run)
+    return replace(first, payload=payload)
+
+
+def _coalesce(events: list[UIEvent]) -> list[UIEvent]:
+    """Merge consecutive assistant text deltas of a session; other events keep their place."""
+    merged: list[UIEvent] = []
+    run: list[UIEvent] = []
+    for event in events:
+        if _is_text_delta(event) and (not run or event.session_id == run[0].session_id):
+            run.append(event)
+            continue
+        if run:
+            merged.append(_merge_deltas(run))
+            run = []
+        if _is_text_delta(event):
+            run.append(event)
+        else:
+            merged.append(event)
+    if run:
+        merged.append(_merge_deltas(run))
+    return merged
+
+
 class UIEventBus:
     def __init__(self) -> None:
-        self._queue: asyncio.Queue[UIEvent] = asyncio.Queue()
+        # Single event loop, polled by the UI: a plain deque needs no futures or locks
+        self._events: deque[UIEvent] = deque()
 
     async def publish(self, event: UIEvent) -> None:
-        await self._queue.put(event)
+        self._events.append(event)
 
     async def drain(self, limit: int = 100) -> list[UIEvent]:
-        events: list[UIEvent] = []
-        for _ in range(limit):
-            try:
-                events.append(self._queue.get_nowait())
-            except asyncio.QueueEmpty:
-                break
-        return events
+        """Take up to ``limit`` published events, with streamed text deltas merged."""
+        events = self._events
+        popleft = events.popleft
+        return _coalesce([popleft() for _ in range(min(limit, len(events)))])
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from typing import Literal
 
-from pydantic import BaseModel, Field
-
 UIEventType = Literal["message", "tool_call", "tool_result", "plan", "status", "diff", "context", "stream_end"]
 UIEventSource = Literal["agent", "ui", "system"]
 
 
-class UIEvent(BaseModel):
+@dataclass(frozen=True, slots=True)
+class UIEvent:
+    """In-process event between the agent loop and the UI; built internally, so not validated."""
+
     event_id: str
     type: UIEventType
-    timestamp: datetime = Field(default_factory=datetime.now)
     session_id: str
     payload: dict
     source: UIEventSource
+    # Raw wall-clock nanoseconds; cheaper to stamp than a datetime
+    timestamp_ns: int = field(default_factory=time.time_ns)
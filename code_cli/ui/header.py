@@ -6,9 +6,26 @@ from rich.text import Text
 from textual.reactive import reactive
 from textual.widget import Widget
 
-from .theme import COLORS, get_icon
+from .theme import COLORS, TYPOGRAPHY, get_icon
 from .widgets import SafeArmState
 
+# Mode pill label and style per safety state; unknown states show as ARMED*
+_MODE_PILLS = {
+    SafeArmState.SAFE.value: (" SAFE ", f"on {COLORS['accent_orange']} {COLORS['bg']}"),
+    SafeArmState.ARMED.value: (" ARMED ", f"on {COLORS['success']} {COLORS['bg']}"),
+}
+_MODE_PILL_OTHER = (" ARMED* ", f"on {COLORS['accent_cyan']} {COLORS['bg']}")
+
+# Every possible CTX bar, indexed by the number of filled cells
+_CTX_BAR_WIDTH = 8
+_CTX_BARS = tuple("█" * filled + "░" * (_CTX_BAR_WIDTH - filled) for filled in range(_CTX_BAR_WIDTH + 1))
+
+
+def _ctx_color(pct: int) -> str:
+    if pct < 70:
+        return COLORS["accent_cyan"]
+    return COLORS["accent_orange"] if pct < 90 else COLORS["danger"]
+
 
 class CodenticHeader(Widget):
     """Two-line header for CODENTIC with branch, model, CTX bar, queue, latency."""
@@ -24,54 +41,58 @@ class CodenticHeader(Widget):
     latency_ms = reactive(0)
     is_active = reactive(False)
 
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self._icons: dict[str, str] = {}
+
+    def validate_tokens_per_sec(self, value: float) -> float:
+        # Shown with one decimal; rounding lets unchanged readings skip the repaint
+        return round(value, 1)
+
+    def _icon(self, name: str) -> str:
+        """get_icon() loads the config on every call, so look each icon up once."""
+        icon = self._icons.get(name)
+        if icon is None:
+            icon = self._icons[name] = get_icon(name)
+        return icon
+
     def render(self) -> RenderableType:
         # Line 1: CODENTIC title + version + activity spinner
         line1 = Text()
-        line1.append("CODENTIC", style=f"bold {COLORS['text']}")
+        line1.append("CODENTIC", style=TYPOGRAPHY["title"])
         line1.append(" v0.7.0", style=COLORS["text_muted"])
         if self.is_active:
-            spinner = get_icon("spinner")
+            spinner = self._icon("spinner")
             line1.append(f" {spinner}", style=COLORS["accent_cyan"])
         
         # Line 2: Mode pill | Branch | Model | CTX bar | Queue | Latency
         line2 = Text()
         
         # Mode pill
-        if self.mode == SafeArmState.SAFE.value:
-            mode_bg = COLORS["accent_orange"]
-            mode_text = "SAFE"
-        elif self.mode == SafeArmState.ARMED.value:
-            mode_bg = COLORS["success"]
-            mode_text = "ARMED"
-        else:
-            mode_bg = COLORS["accent_cyan"]
-            mode_text = "ARMED*"
-        
-        line2.append(f" {mode_text} ", style=f"on {mode_bg} {COLORS['bg']}")
+        mode_text, mode_style = _MODE_PILLS.get(self.mode, _MODE_PILL_OTHER)
+        line2.append(mode_text, style=mode_style)
         line2.append(" | ", style=COLORS["text_muted"])
         
         # Branch
-        branch_icon = get_icon("branch")
+        branch_icon = self._icon("branch")
         line2.append(f"{branch_icon} {self.branch}", style=COLORS["text"])
         line2.append(" | ", style=COLORS["text_muted"])
         
         # Model
-        model_icon = get_icon("model")
+        model_icon = self._icon("model")
         line2.append(f"{model_icon} {self.model}", style=COLORS["text"])
         line2.append(" | ", style=COLORS["text_muted"])
         
         # CTX bar (visual bar, not percentage)
-        ctx_bar_width = 8
-        ctx_filled = int((self.ctx_pct / 100) * ctx_bar_width) if self.ctx_max > 0 else 0
-        ctx_bar = "█" * ctx_filled + "░" * (ctx_bar_width - ctx_filled)
-        ctx_color = COLORS["accent_cyan"] if self.ctx_pct < 70 else COLORS["accent_orange"] if self.ctx_pct < 90 else COLORS["danger"]
+        ctx_filled = int((self.ctx_pct / 100) * _CTX_BAR_WIDTH) if self.ctx_max > 0 else 0
+        ctx_bar = _CTX_BARS[max(0, min(ctx_filled, _CTX_BAR_WIDTH))]
         line2.append(f"CTX ", style=COLORS["text_muted"])
-        line2.append(ctx_bar, style=ctx_color)
+        line2.append(ctx_bar, style=_ctx_color(self.ctx_pct))
         line2.append(f" {self.ctx_pct}%", style=COLORS["text_muted"])
         line2.append(" | ", style=COLORS["text_muted"])
         
         # Queue count (always show, even if 0)
-        queue_icon = get_icon("queue")
+        queue_icon = self._icon("queue")
         queue_style = COLORS["accent_orange"] if self.queue_count > 0 else COLORS["text_muted"]
         line2.append(f"{queue_icon} {self.queue_count}", style=queue_style)
         line2.append(" | ", style=COLORS["text_muted"])
@@ -83,12 +104,7 @@ class CodenticHeader(Widget):
         
         # Tokens/sec (show if streaming)
         if self.tokens_per_sec > 0:
-            tokens_icon = get_icon("tokens")
+            tokens_icon = self._icon("tokens")
             line2.append(f"{tokens_icon} {self.tokens_per_sec:.1f}/s", style=COLORS["accent_cyan"])
         
-        content = Text()
-        content.append(line1)
-        content.append("\n")
-        content.append(line2)
-        
-        return Align.left(content)
+        return Align.left(Text("\n").join((line1, line2)))
@@ -25,6 +25,7 @@ from .cards import (
     ToolCallCard,
     ToolResultCard,
     UserMessageCard,
+    _more_lines_than,
 )
 from .theme import COLORS, get_icon
 
@@ -275,13 +276,11 @@ class PinnedActivityBar(Widget):
         """Update elapsed time from start_time. Call periodically."""
         import time
         if self._active and self._start_time > 0:
-            self._elapsed_seconds = int(time.time() - self._start_time)
-            self.refresh()
+            self.update_elapsed(int(time.time() - self._start_time))
     
     def update_elapsed(self, seconds: int) -> None:
-        """Update elapsed time."""
+        """Update elapsed time; the reactive repaints only when the value changes."""
         self._elapsed_seconds = seconds
-        self.refresh()
     
     def render(self) -> RenderableType:
         if not self._active:
@@ -310,33 +309,68 @@ class PinnedActivityBar(Widget):
 
 
 class TranscriptPane(ScrollableContainer):
-    """Main transcript pane showing timeline of cards."""
+    """Main transcript pane showing timeline of cards.
+
+    Long transcripts are windowed: cards well outside the viewport get
+    ``display = False`` and spacers take their last measured height,
+    so layout and render cost follow the visible cards while the scroll
+    geometry stays put. Cards are hidden rather than unmounted, so streaming
+    and collapsed state survive scrolling away and back.
+    """
     
     can_focus = True
     _user_at_bottom = reactive(True)
+
+    # Below this many cards everything stays displayed
+    VIRTUAL_MIN_CARDS = 40
+    # The newest cards are always displayed; they are the ones still changing
+    VIRTUAL_TAIL_CARDS = 4
+
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._card_count = 0  # Cards other than the empty-state card
+        self._card_heights: dict[Widget, int] = {}  # Measured at the current width
+        self._measured_width = 0
+        self._window_pending = False
     
     def compose(self) -> ComposeResult:
+        # Spacers stand in for the hidden cards above and below the window
+        yield Static(id="transcript-spacer-top", classes="transcript-spacer")
         with Vertical(id="transcript-list"):
             yield Static(id="transcript-top")
+        yield Static(id="transcript-spacer-bottom", classes="transcript-spacer")
 
     def _list(self) -> Vertical:
         return self.query_one("#transcript-list", Vertical)
 
     def _append_card(self, card: Widget) -> Widget:
         """Append a card to the transcript list and autoscroll if at bottom."""
+        if not isinstance(card, EmptyStateCard):
+            self._card_count += 1
         self._list().mount(card)
         if self._user_at_bottom:
             # Scroll after layout is updated to avoid reflow jumps
             self.call_after_refresh(self.scroll_end, animate=False)
+        self._schedule_window()
         return card
 
     def card_children(self) -> list[Widget]:
         """Return list of card widgets in the transcript."""
         return list(self._list().children)
 
+    @property
+    def card_count(self) -> int:
+        """Number of cards in the transcript, excluding the empty-state card."""
+        return self._card_count
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the transcript holds no cards besides the empty-state card."""
+        return self._card_count == 0
+
     def has_non_empty_cards(self) -> bool:
         """Check if transcript has any non-empty-state cards."""
-        return any(not isinstance(c, EmptyStateCard) for c in self._list().children)
+        return not self.is_empty
     
     def add_message(self, role: str, content: str) -> UserMessageCard | AgentMessageCard:
         """Add a message card."""
@@ -372,14 +406,14 @@ class TranscriptPane(ScrollableContainer):
     ) -> ToolResultCard:
         """Add a tool result card."""
         card = ToolResultCard(tool_name, arguments, result, is_error, classes="card")
-        if len(result.splitlines()) > 18:
+        if _more_lines_than(result, 18):
             card.collapsed = True
         return self._append_card(card)
     
     def add_diff(self, diff_text: str, file_path: str = "") -> DiffCard:
         """Add a diff card."""
         card = DiffCard(diff_text, file_path, classes="card")
-        if len(diff_text.splitlines()) > 10:
+        if _more_lines_than(diff_text, 10):
             card.collapsed = True
         return self._append_card(card)
     
@@ -391,7 +425,7 @@ class TranscriptPane(ScrollableContainer):
     def add_plan(self, content: str) -> PlanCard:
         """Add a plan card."""
         card = PlanCard("PLAN", content, classes="card")
-        if len(content.splitlines()) > 18:
+        if _more_lines_than(content, 18):
             card.collapsed = True
         return self._append_card(card)
     
@@ -405,6 +439,7 @@ class TranscriptPane(ScrollableContainer):
         """Remove empty state card if present."""
         for child in list(self._list().children):
             if isinstance(child, EmptyStateCard):
+                self._card_heights.pop(child, None)
                 child.remove()
 
     def clear_cards(self) -> None:
@@ -412,6 +447,94 @@ class TranscriptPane(ScrollableContainer):
         for child in list(self._list().children):
             if child.id != "transcript-top":
                 child.remove()
+        self._set_spacers(0, 0)
+        self._card_heights.clear()
+        self._measured_width = 0
+        self._card_count = 0
+        self._schedule_window()
+
+    def _schedule_window(self) -> None:
+        """Recompute the displayed window once the pending layout has settled."""
+        if not self._window_pending:
+            self._window_pending = True
+            self.call_after_refresh(self._update_window)
+
+    def _update_window(self) -> None:
+        """Display the cards near the viewport and size the spacers for the rest."""
+        self._window_pending = False
+        if not self.is_mounted:
+            return
+        transcript_list = self._list()
+        children = list(transcript_list.children)
+        heights = self._card_heights
+        width = self.size.width
+        if self._card_count < self.VIRTUAL_MIN_CARDS or width != self._measured_width:
+            # Card heights depend on the width: show everything and measure again
+            for child in children:
+                if not child.display:
+                    child.display = True
+            if heights:
+                self._set_spacers(0, 0)
+                heights.clear()
+            if self._card_count >= self.VIRTUAL_MIN_CARDS:
+                self._measured_width = width
+                self._schedule_window()
+            return
+
+        for child in children:
+            if child.display and child.outer_size.height:
+                heights[child] = child.outer_size.height
+
+        viewport = self.size.height
+        window_top = self.scroll_y - viewport
+        window_bottom = self.scroll_y + 2 * viewport
+        pad_top = pad_bottom = 0
+        y = 0
+        for index, child in enumerate(children):
+            height = heights.get(child)
+            if height is None:
+                # Not laid out yet; keep it displayed so it gets measured
+                hide = False
+            elif index >= len(children) - self.VIRTUAL_TAIL_CARDS:
+                hide = False
+            elif y + height <= window_top and pad_top == y:
+                # Only a leading run of cards can be folded into the top spacer
+                hide = True
+                pad_top += height
+            elif y >= window_bottom:
+                hide = True
+                pad_bottom += height
+            else:
+                hide = False
+            if child.display == hide:
+                child.display = not hide
+            y += height or 0
+
+        self._set_spacers(pad_top, pad_bottom)
+
+    def _set_spacers(self, top: int, bottom: int) -> None:
+        for spacer_id, height in (("#transcript-spacer-top", top), ("#transcript-spacer-bottom", bottom)):
+            spacer = self.query_one(spacer_id, Static)
+            if spacer.styles.height is None or spacer.styles.height.value != height:
+                spacer.styles.height = height
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self._card_count < self.VIRTUAL_MIN_CARDS:
+            return
+        if abs(new_value - old_value) > self.size.height:
+            # A jump (scroll_end, scrollbar drag) would show blank spacer until the next refresh
+            self._update_window()
+        else:
+            self._schedule_window()
+
+    def watch_virtual_size(self) -> None:
+        # Cards were laid out or changed height
+        if self._card_count >= self.VIRTUAL_MIN_CARDS:
+            self._schedule_window()
+
+    def on_resize(self) -> None:
+        self._schedule_window()
     
     def on_scroll(self) -> None:
         """Track if user is at bottom for smart autoscroll."""
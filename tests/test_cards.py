@@ -93,3 +93,395 @@ And some more text."""
     assert "print('hello')" in parts[1][2]
     assert parts[2][0] == "text"
     assert "And some more text" in parts[2][1]
+
+
+def test_agent_message_card_append_buffers_until_flush():
+    """Appended text is buffered and folded into content when streaming stops."""
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard()
+    card.append("Hello, ")
+    card.append("world")
+    assert card.content == ""
+
+    card.stop_streaming()
+    assert card.content == "Hello, world"
+
+
+def test_agent_message_card_reuses_parse_until_content_changes():
+    """Parsed parts are cached until the content grows or is replaced."""
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard("Intro\n\n```python\nx = 1\n```")
+    parts = card._parsed_parts()
+    assert card._parsed_parts() is parts
+
+    card.append("\nMore")
+    card.stop_streaming()
+    assert card._parsed_parts() is not parts
+    assert card._parsed_parts()[-1] == ("text", "More")
+
+    card.content = "replaced"
+    assert card._parsed_parts() == [("text", "replaced")]
+
+
+def test_agent_message_card_collapsed_flush_skips_hidden_lines():
+    """Text appended past the collapsed view does not mark the card for re-render."""
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard("\n".join(f"line {i}" for i in range(20)))
+    card.collapsed = True
+    card.append("\nmore")
+    card._flush_buffer()
+    assert card._render_stale is False
+    assert card.content.endswith("more")
+
+    card.collapsed = False
+    card.append("\neven more")
+    card._flush_buffer()
+    assert card._render_stale is True
+
+
+def test_tool_call_card_args_json_follows_reassignment():
+    """Serialized arguments are reused across renders and refreshed on reassignment."""
+    from code_cli.ui.cards import PendingToolCallCard
+
+    card = PendingToolCallCard("shell", {"cmd": "ls"})
+    args_json = card._args_json()
+    assert card._args_json() is args_json
+    rendered = _render_to_text(card.render())
+    assert "cmd" in rendered and "ls" in rendered
+
+    card.arguments = {"cmd": "pwd"}
+    assert '"cmd": "pwd"' in card._args_json()
+
+
+def test_truncate_keeps_first_lines_only():
+    """Collapsed bodies keep the first lines and mark the cut with an ellipsis."""
+    from code_cli.ui.cards import SystemCard
+
+    card = SystemCard("x")
+    text = "\n".join(f"line {i}" for i in range(20))
+    assert card._truncate(text, limit=3) == "line 0\nline 1\nline 2\n..."
+    assert card._truncate("a\nb\nc", limit=3) == "a\nb\nc"
+    assert card._truncate("a\nb\nc\n", limit=3) == "a\nb\nc\n"
+
+
+def test_more_lines_than_matches_splitlines():
+    from code_cli.ui.cards import _more_lines_than
+
+    for text in ("", "a", "a\n", "a\nb", "a\nb\n", "a\nb\nc", "\n\n\n"):
+        for limit in range(4):
+            assert _more_lines_than(text, limit) == (len(text.splitlines()) > limit)
+
+
+def test_diff_card_collapsed_summary_is_cached():
+    """The collapsed diff preview is computed once and reused across renders."""
+    from code_cli.ui.cards import DiffCard
+
+    card = DiffCard("--- a\n+++ b\n@@ -1 +1 @@\n-old\n+new", file_path="x.py")
+    summary = card._summary()
+    assert summary.startswith("5 lines changed")
+    assert card._summary() is summary
+
+
+def test_diff_card_summary_counts_lines_like_splitlines():
+    from code_cli.ui.cards import DiffCard
+
+    for diff in ("", "+a\n", "+a\n-b", "+1\n+2\n+3\n+4\n+5\n+6\n"):
+        assert DiffCard(diff)._summary().startswith(f"{len(diff.splitlines())} lines changed")
+    assert DiffCard("+1\n+2\n+3\n+4\n+5\n+6\n")._summary().endswith("+3\n...")
+
+
+def test_tool_card_reuses_syntax_until_body_changes():
+    """The highlighted body is reused across renders; collapsed cards skip highlighting."""
+    from rich.text import Text
+
+    from code_cli.ui.cards import ToolCallCard
+
+    card = ToolCallCard("shell", {"cmd": "\n".join(str(i) for i in range(30))})
+    first = card.render().renderable
+    assert card.render().renderable is first
+
+    card.collapsed = True
+    assert isinstance(card.render().renderable, Text)
+
+
+def test_tool_result_card_shows_plain_output_without_syntax():
+    from rich.text import Text
+
+    from code_cli.ui.cards import ToolResultCard
+
+    card = ToolResultCard("shell", result="\n".join(str(i) for i in range(30)))
+    assert isinstance(card.render().renderable, Text)
+    assert card._syntax_cache is None
+
+
+def test_code_block_widgets_share_syntax_for_identical_code():
+    """Re-created code blocks with the same text reuse one Syntax renderable."""
+    first = CodeBlockWidget("x = 1", language="python").render().renderable
+    second = CodeBlockWidget("x = 1", language="python").render().renderable
+    assert first is second
+
+
+async def test_agent_message_card_rebuild_keeps_stable_blocks():
+    """Streaming more text keeps finished blocks mounted and updates the tail in place."""
+    from textual.app import App
+
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard()
+
+    class CardApp(App):
+        def compose(self):
+            yield card
+
+    async with CardApp().run_test() as pilot:
+        card.start_streaming()
+        card.append("Intro\n\n```python\nx = 1\n```\n\nTail")
+        card._flush_buffer()
+        await pilot.pause()
+        before = list(card._block_widgets)
+        assert [b[0] for b in card._mounted_blocks] == ["text", "code", "text"]
+
+        card.append(" grows")
+        card._flush_buffer()
+        await pilot.pause()
+        assert card._block_widgets == before
+        assert card._mounted_blocks[-1] == ("text", "Tail grows")
+
+        card.append("\n\n```sh\nls\n```")
+        card.stop_streaming()
+        await pilot.pause()
+        assert card._block_widgets[:3] == before
+        assert list(card.query("#agent-content > *")) == card._block_widgets
+        assert "DONE" in card._build_header().plain
+        assert card._header_cache[0] == "done"
+
+
+async def test_agent_message_card_streams_plain_prose_without_markdown():
+    """Plain streamed prose is shown as Text and upgraded to Markdown when done."""
+    from rich.markdown import Markdown
+    from rich.text import Text
+    from textual.app import App
+    from textual.widgets import Static
+
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard()
+
+    def shown(widget):
+        # Static.renderable became Static.content in newer Textual releases
+        return getattr(widget, "renderable", None) or widget.content
+
+    class CardApp(App):
+        def compose(self):
+            yield card
+
+    async with CardApp().run_test() as pilot:
+        card.start_streaming()
+        card.append("Plain")
+        card._flush_buffer()
+        card.append(" prose")
+        card._flush_buffer()
+        await pilot.pause()
+        tail = card._block_widgets[-1]
+        assert isinstance(shown(tail), Text)
+
+        # Settled by a following code block: upgraded while the stream goes on
+        card.append("\n\n```sh\nls\n```\n\nTail")
+        card._flush_buffer()
+        await pilot.pause()
+        assert isinstance(shown(tail), Markdown)
+
+        card.append(" grows")
+        card._flush_buffer()
+        assert isinstance(shown(card._block_widgets[-1]), Text)
+        card.append(" with *emphasis*")
+        card._flush_buffer()
+        assert isinstance(shown(card._block_widgets[-1]), Markdown)
+        card.append(" and more")
+        card._flush_buffer()
+
+        card.stop_streaming()
+        await pilot.pause()
+        text_widgets = [w for w in card._block_widgets if isinstance(w, Static)]
+        assert len(text_widgets) == 2
+        assert all(isinstance(shown(w), Markdown) for w in text_widgets)
+        assert not card._plain_widgets
+
+
+def test_agent_message_card_flush_timer_pauses_when_idle():
+    """The flush timer pauses on an idle tick and resumes on the next append."""
+    from unittest.mock import Mock
+
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard()
+    card._flush_timer = timer = Mock()
+    card._flush_buffer()
+    timer.pause.assert_called_once()
+
+    card.append("more")
+    timer.resume.assert_called_once()
+
+
+def test_agent_message_card_incremental_parse_matches_full_parse():
+    """Parsing streamed text incrementally gives the same parts as a full parse."""
+    from code_cli.ui.cards import AgentMessageCard
+
+    text = "Intro\n\n```python\nx = 1\n```\n\nMiddle\n```sh\nls\n```\nTail ``` open"
+    card = AgentMessageCard()
+    for i in range(0, len(text), 3):
+        card.append(text[i:i + 3])
+        card._take_buffer()
+        assert card._parsed_parts() == card._parse_content_with_code_blocks(card.content)
+    assert card._parsed_prefix_end == text.index("Tail") - 1
+
+
+def test_code_block_widget_skips_highlighting_for_huge_blocks():
+    """Blocks past the size cap render as plain text with a hint in the header."""
+    from rich.text import Text
+
+    from code_cli.ui.cards import _HIGHLIGHT_MAX_BYTES
+
+    widget = CodeBlockWidget("x" * (_HIGHLIGHT_MAX_BYTES + 1), language="python")
+    panel = widget.render()
+    assert isinstance(panel.renderable, Text)
+    assert "not highlighted" in panel.title.plain
+
+
+def test_code_blocks_share_header_per_language():
+    a = CodeBlockWidget("x = 1", language="python").render()
+    b = CodeBlockWidget("y = 2", language="python").render()
+    assert a.title is b.title
+    assert "python" in a.title.plain
+
+
+async def test_copy_falls_back_to_osc52_without_clipboard_tool(monkeypatch):
+    """With no clipboard tool installed, copying goes through the terminal."""
+    from unittest.mock import Mock
+
+    from code_cli.ui import cards
+
+    monkeypatch.setattr(cards, "_CLIP_CMD", None)
+    widget = CodeBlockWidget("print('hi')", language="python")
+    app = Mock()
+    monkeypatch.setattr(CodeBlockWidget, "app", app)
+    await widget.action_copy_code()
+    app.copy_to_clipboard.assert_called_once_with("print('hi')")
+
+
+def test_agent_message_card_reuses_markdown_for_rebuilt_text_blocks():
+    """Text blocks re-created with the same text share one parsed Markdown."""
+    from code_cli.ui.cards import _markdown_for
+
+    assert _markdown_for("Some *notes*") is _markdown_for("Some *notes*")
+
+
+def test_strip_span_matches_str_strip():
+    """Trimming a span in place gives the same result as slicing and stripping."""
+    from code_cli.ui.cards import _strip_span
+
+    text = "  \n intro text \n\n```py\n  x = 1\n```\n\t "
+    for start, end in [(0, len(text)), (0, 16), (5, 9), (17, 17), (len(text) - 3, len(text))]:
+        assert _strip_span(text, start, end) == text[start:end].strip()
+
+
+async def test_copy_pipes_text_to_clipboard_tool(monkeypatch, tmp_path):
+    """With a clipboard tool configured, the text is piped to it without blocking."""
+    import sys
+    from unittest.mock import Mock
+
+    from code_cli.ui import cards
+
+    out = tmp_path / "clip.txt"
+    script = f"import sys; open({str(out)!r}, 'w').write(sys.stdin.read())"
+    monkeypatch.setattr(cards, "_CLIP_CMD", [sys.executable, "-c", script])
+    widget = CodeBlockWidget("print('hi')", language="python")
+    app = Mock()
+    monkeypatch.setattr(CodeBlockWidget, "app", app)
+    await widget.action_copy_code()
+    assert out.read_text() == "print('hi')"
+    app.notify.assert_called_once_with("Copied to clipboard", severity="information")
+
+
+def test_update_status_class_only_touches_classes_on_change(monkeypatch):
+    from code_cli.ui.cards import AgentMessageCard
+
+    card = AgentMessageCard()
+    calls = []
+    monkeypatch.setattr(card, "add_class", lambda *c: calls.append(("add", c)))
+    monkeypatch.setattr(card, "remove_class", lambda *c: calls.append(("remove", c)))
+    card._update_status_class("streaming")
+    card._update_status_class("streaming")
+    card._update_status_class("done")
+    card._update_status_class("done")
+    assert calls == [("add", ("streaming",)), ("remove", ("streaming",))]
+
+
+def test_diff_and_error_card_titles_look_up_icons_once(monkeypatch):
+    from code_cli.ui import cards
+
+    calls = []
+    monkeypatch.setattr(cards, "get_icon", lambda name: calls.append(name) or "*")
+    diff = cards.DiffCard("+a", file_path="x.py")
+    error = cards.ErrorCard("boom")
+    for _ in range(3):
+        assert diff.render().title.startswith("* DIFF · x.py")
+        assert error.render().title.startswith("* ERROR")
+    assert calls == ["diff", "error"]
+
+
+async def test_failing_clipboard_tool_falls_back_to_osc52_for_good(monkeypatch):
+    import sys
+    from unittest.mock import Mock
+
+    from code_cli.ui import cards
+
+    monkeypatch.setattr(cards, "_CLIP_CMD", [sys.executable, "-c", "raise SystemExit(1)"])
+    widget = CodeBlockWidget("x", language="text")
+    app = Mock()
+    monkeypatch.setattr(CodeBlockWidget, "app", app)
+    await widget.action_copy_code()
+    app.copy_to_clipboard.assert_called_once_with("x")
+    assert cards._CLIP_CMD is None
+
+
+def test_static_cards_reuse_their_panel_until_inputs_change():
+    from code_cli.ui.cards import ErrorCard, PlanCard, UserMessageCard
+
+    for card in (PlanCard("PLAN", "- step"), UserMessageCard("hi"), SystemCard("note"), ErrorCard("boom")):
+        panel = card.render()
+        assert card.render() is panel
+        card.collapsed = True
+        assert card.render() is not panel
+
+
+def test_tool_call_cards_reuse_panel_until_state_changes():
+    from code_cli.ui.cards import PendingToolCallCard, ToolCallCard
+
+    card = ToolCallCard("shell", {"cmd": "ls"})
+    panel = card.render()
+    assert card.render() is panel
+    card.status = "success"
+    assert card.render() is not panel
+    panel = card.render()
+    card.arguments = {"cmd": "pwd"}
+    assert card.render() is not panel
+
+    pending = PendingToolCallCard("shell", {"cmd": "ls"})
+    panel = pending.render()
+    assert pending.render() is panel
+    assert "PENDING" in panel.title
+
+
+def test_syntax_objects_share_lexers_and_theme():
+    from code_cli.ui.cards import ToolCallCard
+
+    first = ToolCallCard("a", {"x": 1}).render().renderable
+    second = ToolCallCard("b", {"y": 2}).render().renderable
+    assert first.lexer is second.lexer
+    assert first._theme is second._theme
+    # Unknown fence languages fall back to plain text, as Syntax does by name
+    assert CodeBlockWidget("x", language="no-such-lang").render().renderable.lexer.name == "Text only"
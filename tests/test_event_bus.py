@@ -0,0 +1,46 @@
+from code_cli.ui.event_bus import UIEventBus
+from code_cli.ui.events import UIEvent
+
+
+def _event(n: int, type: str = "message", session_id: str = "s") -> UIEvent:
+    payload = {"role": "assistant", "delta": str(n)} if type == "message" else {}
+    return UIEvent(
+        event_id=str(n),
+        type=type,
+        session_id=session_id,
+        payload=payload,
+        source="agent",
+    )
+
+
+async def test_drain_returns_events_in_order_up_to_limit():
+    bus = UIEventBus()
+    for n in range(5):
+        await bus.publish(_event(n, type="status"))
+
+    assert [e.event_id for e in await bus.drain(limit=3)] == ["0", "1", "2"]
+    assert [e.event_id for e in await bus.drain()] == ["3", "4"]
+    assert await bus.drain() == []
+
+
+async def test_drain_merges_consecutive_text_deltas():
+    bus = UIEventBus()
+    for event in (
+        _event(1), _event(2), _event(3),
+        _event(4, type="tool_result"),
+        _event(5), _event(6, session_id="other"), _event(7, session_id="other"),
+    ):
+        await bus.publish(event)
+
+    drained = await bus.drain()
+    assert [e.type for e in drained] == ["message", "tool_result", "message", "message"]
+    assert drained[0].payload == {"role": "assistant", "delta": "123", "chunks": 3}
+    assert drained[2].payload == {"role": "assistant", "delta": "5"}
+    assert drained[3].payload["delta"] == "67"
+    assert drained[3].payload["chunks"] == 2
+
+
+def test_event_is_stamped_with_wall_clock_nanoseconds():
+    import time
+
+    assert abs(_event(0).timestamp_ns - time.time_ns()) < 5 * 10**9
@@ -0,0 +1,55 @@
+from code_cli.ui import header as header_module
+from code_cli.ui.header import CodenticHeader
+from code_cli.ui.widgets import SafeArmState
+
+
+def _plain(header: CodenticHeader) -> str:
+    return header.render().renderable.plain
+
+
+def test_header_shows_mode_pill_per_safety_state():
+    header = CodenticHeader()
+    assert " SAFE " in _plain(header)
+    header.mode = SafeArmState.ARMED.value
+    assert " ARMED " in _plain(header)
+    header.mode = SafeArmState.ARMED_PENDING.value
+    assert " ARMED* " in _plain(header)
+
+
+def test_header_looks_up_each_icon_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(header_module, "get_icon", lambda name: calls.append(name) or "*")
+    header = CodenticHeader()
+    header.tokens_per_sec = 3.0
+    for _ in range(3):
+        header.render()
+    assert sorted(calls) == ["branch", "model", "queue", "tokens"]
+
+
+def test_header_ctx_bar_is_clamped_to_its_width():
+    header = CodenticHeader()
+    header.ctx_max = 1000
+    header.ctx_pct = 50
+    assert "████░░░░ 50%" in _plain(header)
+    header.ctx_pct = 130
+    assert "████████ 130%" in _plain(header)
+
+
+def test_header_ignores_tokens_per_sec_changes_below_display_precision():
+    header = CodenticHeader()
+    header.tokens_per_sec = 12.34
+    assert header.tokens_per_sec == 12.3
+    assert "12.3/s" in _plain(header)
+
+
+def test_header_repaints_when_tokens_per_sec_rounds_differently(monkeypatch):
+    header = CodenticHeader()
+    header.tokens_per_sec = 12.34
+    refreshes = []
+    monkeypatch.setattr(header, "refresh", lambda *a, **k: refreshes.append(1))
+    header.tokens_per_sec = 12.31
+    assert refreshes == []
+    header.tokens_per_sec = 12.36
+    assert header.tokens_per_sec == 12.4
+    assert refreshes == [1]
+    assert "12.4/s" in _plain(header)
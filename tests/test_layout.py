@@ -13,3 +13,132 @@ def test_transcript_pane_has_add_system_message():
     # Method should exist
     assert hasattr(pane, 'add_system_message')
     assert callable(getattr(pane, 'add_system_message'))
+
+
+def test_transcript_pane_starts_empty():
+    """A fresh TranscriptPane reports itself empty without walking the DOM."""
+    from code_cli.ui.layout import TranscriptPane
+
+    pane = TranscriptPane()
+    assert pane.is_empty
+    assert pane.card_count == 0
+    assert not pane.has_non_empty_cards()
+
+
+def test_activity_bar_skips_repaint_for_unchanged_elapsed_time(monkeypatch):
+    from code_cli.ui.layout import PinnedActivityBar
+
+    bar = PinnedActivityBar()
+    refreshes = []
+    monkeypatch.setattr(bar, "refresh", lambda *a, **k: refreshes.append(1))
+    bar.update_elapsed(0)
+    assert refreshes == []
+
+
+def test_activity_bar_repaints_when_elapsed_time_changes(monkeypatch):
+    from code_cli.ui.layout import PinnedActivityBar
+
+    bar = PinnedActivityBar()
+    refreshes = []
+    monkeypatch.setattr(bar, "refresh", lambda *a, **k: refreshes.append(1))
+    bar.update_elapsed(3)
+    assert refreshes == [1]
+
+
+def _transcript_app():
+    """A bare app holding one TranscriptPane, with the card CSS windowing relies on."""
+    from textual.app import App
+
+    from code_cli.ui.layout import TranscriptPane
+
+    class TranscriptApp(App):
+        CSS = """
+        #transcript-list { height: auto; }
+        .card { height: auto; margin: 0; }
+        .transcript-spacer { height: 0; }
+        """
+
+        def compose(self):
+            yield TranscriptPane()
+
+    return TranscriptApp()
+
+
+@pytest.mark.asyncio
+async def test_transcript_pane_only_displays_cards_near_the_viewport():
+    """Long transcripts hide far-away cards but keep their scroll height."""
+    from code_cli.ui.layout import TranscriptPane
+
+    app = _transcript_app()
+    async with app.run_test(size=(80, 20)) as pilot:
+        pane = app.query_one(TranscriptPane)
+        for n in range(100):
+            pane.add_system_message(f"message {n}")
+        await pilot.pause(0.3)
+        full_height = pane.virtual_size.height
+
+        cards = pane.card_children()
+        assert len(cards) == 101
+        assert sum(card.display for card in cards) < 40
+        assert all(card.display for card in cards[-TranscriptPane.VIRTUAL_TAIL_CARDS:])
+
+        pane.scroll_to(y=full_height // 2, animate=False)
+        await pilot.pause(0.3)
+        middle = cards[len(cards) // 2]
+        assert middle.display
+        assert not cards[1].display
+        assert pane.virtual_size.height == full_height
+
+        pane.clear_cards()
+        await pilot.pause(0.3)
+        assert all(card.display for card in pane.card_children())
+
+
+@pytest.mark.asyncio
+async def test_transcript_pane_displays_cards_right_after_jumping_to_the_end():
+    """A jump past the window shows the cards there at once, not blank spacer."""
+    from code_cli.ui.layout import TranscriptPane
+
+    app = _transcript_app()
+    async with app.run_test(size=(80, 20)) as pilot:
+        pane = app.query_one(TranscriptPane)
+        for n in range(100):
+            pane.add_system_message(f"message {n}")
+        await pilot.pause(0.3)
+        pane.scroll_to(y=0, animate=False, immediate=True)
+        await pilot.pause(0.3)
+        cards = pane.card_children()
+        # The cards filling the last screen, newest first
+        last_screen, rows = [], 0
+        for card in reversed(cards):
+            last_screen.append(card)
+            rows += pane._card_heights[card]
+            if rows >= pane.size.height:
+                break
+        assert not all(card.display for card in last_screen)
+
+        pane.scroll_to(y=pane.max_scroll_y, animate=False, immediate=True)
+        assert all(card.display for card in last_screen)
+        assert pane.query_one("#transcript-spacer-bottom").styles.height.value == 0
+
+
+@pytest.mark.asyncio
+async def test_transcript_pane_forgets_heights_of_removed_cards():
+    from code_cli.ui.cards import EmptyStateCard
+    from code_cli.ui.layout import TranscriptPane
+
+    app = _transcript_app()
+    async with app.run_test(size=(80, 20)) as pilot:
+        pane = app.query_one(TranscriptPane)
+        pane.show_empty_state()
+        for n in range(50):
+            pane.add_system_message(f"message {n}")
+        await pilot.pause(0.3)
+        empty = pane.query_one(EmptyStateCard)
+        assert empty in pane._card_heights
+
+        pane.remove_empty_state()
+        assert empty not in pane._card_heights
+
+        pane.clear_cards()
+        assert pane._card_heights == {}